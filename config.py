@@ -1,10 +1,12 @@
+import hashlib
 import logging
 import threading
+import time
 import yaml
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import FrozenSet, List, Optional, Union
 from watchdog.observers import Observer as FileSystemObserver
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 
@@ -20,6 +22,13 @@ from organizer import MediaInfoTag, RenameMethod
 
 LOG = logging.getLogger(__name__)
 
+# prefer the libyaml C bindings, fall back to the pure-python implementation
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+    LOG.warning("libyaml not available, using pure-python YAML loader")
+
 
 @dataclass
 class GrabConfig:
@@ -30,6 +39,18 @@ class GrabConfig:
     rename_as_prefix: bool
     mtime: bool
     media_tag: Optional[MediaInfoTag]
+    # normalized (lowercase, dot-prefixed) types for suffix lookups
+    type_suffixes: FrozenSet[str] = field(init=False, repr=False)
+    # final path component, used as the destination folder name
+    dirname: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # types match the last extension only, e.g. 'tar.gz' can never match
+        for t in self.types:
+            if '.' in t.strip('.'):
+                LOG.warning(f"Grab '{self.path}' type '{t}' has multiple extensions and will not match any file, use a single extension (e.g. '{t.rsplit('.', 1)[-1]}')")
+        self.type_suffixes = frozenset(f".{t.lstrip('.').lower()}" for t in self.types if t.strip('.'))
+        self.dirname = Path(self.path).name
 
 @dataclass
 class ChownIds:
@@ -52,6 +73,7 @@ class AppConfigFile(FileSystemEventHandler):
         super(FileSystemEventHandler, self).__init__()
 
         self._lock = threading.Lock()
+        self._last_hash = None
         self._config = AppConfig(
             delete_after_copy = True,
             destination_base = DEFAULT_DESTINATION_BASE,
@@ -81,7 +103,12 @@ class AppConfigFile(FileSystemEventHandler):
 
         self.load()
 
-        self._timer = None
+        # single worker coalesces bursts of modify events into one reload
+        self._pending_deadline = 0.0
+        self._event = threading.Event()
+        self._debounce_thread = threading.Thread(target=self._debounce_worker, daemon=True)
+        self._debounce_thread.start()
+
         self._observer = FileSystemObserver(generate_full_events=True)
         self._observer.schedule(self, path.as_posix(), event_filter=[FileModifiedEvent])
         self._observer.start()
@@ -90,13 +117,27 @@ class AppConfigFile(FileSystemEventHandler):
         return self._config.__str__()
 
     def on_modified(self, event):
-        # Cancel existing timer if one is running
-        if self._timer is not None:
-            self._timer.cancel()
-
-        # Schedule reload with a 1-second delay
-        self._timer = threading.Timer(1.0, self.reload)
-        self._timer.start()
+        # (re)schedule reload with a 1-second delay
+        self._pending_deadline = time.monotonic() + 1.0
+        self._event.set()
+
+    def _debounce_worker(self):
+        while True:
+            self._event.wait()
+
+            # keep waiting while new events push the deadline out,
+            #   only events after the final check trigger another pass
+            while True:
+                self._event.clear()
+                delay = self._pending_deadline - time.monotonic()
+                if delay <= 0:
+                    break
+                self._event.wait(timeout=delay)
+
+            try:
+                self.reload()
+            except Exception as e:
+                LOG.error(f"Failed to reload configuration: {e}")
 
     def load(self):
         """
@@ -104,31 +145,22 @@ class AppConfigFile(FileSystemEventHandler):
         """
         with self._lock:
             with open(self.path.as_posix(), "rb") as f:
-                raw_config = yaml.safe_load(f)
+                raw_bytes = f.read()
 
-        self._config.delete_after_copy = raw_config.get('delete_after_copy', True)
-        setattr(self, 'delete_after_copy', self._config.delete_after_copy)
+        # skip parsing when the file content has not changed
+        config_hash = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+        if config_hash == self._last_hash:
+            LOG.debug(f"Configuration unchanged: {self.path}")
+            return
 
-        destination_base = raw_config.get('destination_base')
-        self._config.destination_base = Path(destination_base) if destination_base else DEFAULT_DESTINATION_BASE
-        setattr(self, 'destination_base', self._config.destination_base)
+        raw_config = yaml.load(raw_bytes, Loader=_YamlLoader)
 
+        # build the new configuration aside, then swap it in atomically
+        destination_base = raw_config.get('destination_base')
         mount_base = raw_config.get('mount_base')
-        self._config.mount_base = Path(mount_base) if mount_base else DEFAULT_MOUNT_BASE
-        setattr(self, 'mount_base', self._config.mount_base)
-
-        log_level = raw_config.get('log_level')
-        self._config.log_level = logging._nameToLevel.get(log_level, DEFAULT_LOG_LEVEL)
-        setattr(self, 'log_level', self._config.log_level)
-
         chown = raw_config.get('chown')
-        self._config.chown = ChownIds(chown.get('user'), chown.get('group')) if chown else None
-        setattr(self, 'chown', self._config.chown)
 
         grab_configs = []
-        self._config.grabs = grab_configs
-        setattr(self, 'grabs', grab_configs)
-
         for path in raw_config['grabs']:
             grab = raw_config['grabs'][path]
             rename_method = RenameMethod.NONE.name
@@ -165,13 +197,24 @@ class AppConfigFile(FileSystemEventHandler):
             grab_configs.append(grab_config)
 
         home_assistant = raw_config.get('home_assistant')
-        self._config.home_assistant = HomeAssistantConfig(
-            base_url = home_assistant.get('base_url', ""),
-            api_token = home_assistant.get('api_token', ""),
-        ) if home_assistant else None
-        setattr(self, 'home_assistant', self._config.home_assistant)
+        config = AppConfig(
+            delete_after_copy = raw_config.get('delete_after_copy', True),
+            destination_base = Path(destination_base) if destination_base else DEFAULT_DESTINATION_BASE,
+            mount_base = Path(mount_base) if mount_base else DEFAULT_MOUNT_BASE,
+            grabs = grab_configs,
+            log_level = logging._nameToLevel.get(raw_config.get('log_level'), DEFAULT_LOG_LEVEL),
+            chown = ChownIds(chown.get('user'), chown.get('group')) if chown else None,
+            home_assistant = HomeAssistantConfig(
+                base_url = home_assistant.get('base_url', ""),
+                api_token = home_assistant.get('api_token', ""),
+            ) if home_assistant else None
+        )
 
-        LOG.debug(f"Configuration:\n{self._config}")
+        with self._lock:
+            self._config = config
+            self._last_hash = config_hash
+
+        LOG.debug(f"Configuration:\n{config}")
 
     def reload(self):
         LOG.info(f"Reloading configuration from {self.path}")
@@ -187,7 +230,7 @@ class AppConfigFile(FileSystemEventHandler):
         c_dict['destination_base'] = self._config.destination_base.as_posix()
         c_dict['mount_base'] = self._config.mount_base.as_posix()
         c_dict['log_level'] = logging._levelToName[self._config.log_level]
-        config_yaml_s = f"# {APP_NAME} configuration\n" + yaml.dump(c_dict)
+        config_yaml_s = f"# {APP_NAME} configuration\n" + yaml.dump(c_dict, Dumper=_YamlDumper)
 
         with open(path.as_posix(), "w") as f:
             f.write(config_yaml_s)
@@ -205,3 +248,31 @@ class AppConfigFile(FileSystemEventHandler):
 
     def get_config(self) -> AppConfig:
         return self._config
+
+    @property
+    def delete_after_copy(self) -> bool:
+        return self._config.delete_after_copy
+
+    @property
+    def destination_base(self) -> Path:
+        return self._config.destination_base
+
+    @property
+    def mount_base(self) -> Path:
+        return self._config.mount_base
+
+    @property
+    def grabs(self) -> List[GrabConfig]:
+        return self._config.grabs
+
+    @property
+    def log_level(self) -> int:
+        return self._config.log_level
+
+    @property
+    def chown(self) -> Optional[ChownIds]:
+        return self._config.chown
+
+    @property
+    def home_assistant(self) -> Optional[HomeAssistantConfig]:
+        return self._config.home_assistant
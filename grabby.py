@@ -1,3 +1,4 @@
+import errno
 import logging
 import os
 import sys
@@ -8,6 +9,7 @@ import shutil
 import subprocess
 import threading
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -34,12 +36,18 @@ class AppState:
 
 
 LOG = logging.getLogger(APP_NAME)
+COPY_MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+DEVICE_PATTERN = re.compile(r"[hs]d[a-z]\d+|mmcblk\d+p\d+")  # e.g. sdb1, mmcblk0p1
+MOUNTINFO_ESCAPE_PATTERN = re.compile(r"\\([0-7]{3})")  # octal escapes, e.g. '\040' for space
+PROC_MOUNTINFO = "/proc/self/mountinfo"
+COPY_FILE_RANGE_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL}
 
 app_config: AppConfigFile = None
 app_state: AppState = None
 home_assistant: HomeAssistantAPI = None
 processed_devices = set()
 device_lock = threading.Lock()
+copy_file_range_supported = hasattr(os, "copy_file_range")
 
 
 def get_mounts(device_node: str) -> List[str]:
@@ -50,9 +58,19 @@ def get_mounts(device_node: str) -> List[str]:
     :returns: List of mount points for the device.
     """
     mounts = []
-    for partition in psutil.disk_partitions():
-        if partition.device == device_node:
-            mounts.append(partition.mountpoint)
+    try:
+        # linux: read the mount table directly, no need to stat every mount
+        with open(PROC_MOUNTINFO) as f:
+            for line in f:
+                # e.g. "36 35 98:0 / /mnt/card rw,noatime shared:1 - vfat /dev/sdb1 rw"
+                fields, _, fs_fields = line.partition(" - ")
+                fs_fields = fs_fields.split()
+                if len(fs_fields) > 1 and fs_fields[1] == device_node:
+                    mounts.append(MOUNTINFO_ESCAPE_PATTERN.sub(lambda m: chr(int(m.group(1), 8)), fields.split()[4]))
+    except OSError:
+        for partition in psutil.disk_partitions():
+            if partition.device == device_node:
+                mounts.append(partition.mountpoint)
     return mounts
 
 
@@ -105,22 +123,67 @@ def unmount_device(mountpoint: str):
     LOG.info(f"Unmounted {mountpoint}")
 
 
-def remove_directory(path):
+def remove_directory_contents(path):
     """
-    Forcefully removes a directory and all its contents.
+    Forcefully removes all contents of a directory, leaving the directory itself in place.
 
-    :param path: Path to the directory to be removed.
+    :param path: Path to the directory to be emptied.
     """
     try:
-        # Forcefully remove the directory and all contents
-        shutil.rmtree(path)
-        print(f"Successfully removed directory: {path}")
+        # Forcefully remove all contents, preserving the directory and its ownership
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        LOG.info(f"Successfully emptied directory: {path}")
     except FileNotFoundError:
-        print(f"Directory not found: {path}")
+        LOG.error(f"Directory not found while emptying directory: {path}")
     except PermissionError:
-        print(f"Permission denied while removing directory: {path}")
+        LOG.error(f"Permission denied while emptying directory: {path}")
     except Exception as e:
-        print(f"Error while removing directory: {path} - {e}")
+        LOG.error(f"Error while emptying directory: {path} - {e}")
+
+
+def copy_file(src: str, dst: str):
+    """
+    Copy a file and its metadata, keeping the data transfer in the kernel where possible.
+
+    Uses os.copy_file_range when the filesystems support it, otherwise shutil.copyfile
+    (sendfile on linux). After the first unsupported attempt, later copies skip the probe.
+
+    :param src: Source file path.
+    :param dst: Destination file path.
+    """
+    global copy_file_range_supported
+
+    LOG.info("Copying %s -> %s", src, dst)
+    if copy_file_range_supported:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            copied_any = False
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        if copied_any:
+                            raise OSError(errno.EIO, f"Short copy: {src}")
+                        raise OSError(errno.EOPNOTSUPP, "copy_file_range copied no data")
+                    copied_any = True
+                    remaining -= copied
+            except OSError as e:
+                # only fall back when unsupported, real errors propagate
+                if copied_any or e.errno not in COPY_FILE_RANGE_UNSUPPORTED_ERRNOS:
+                    raise
+                LOG.debug("copy_file_range unsupported (%s), using copyfile", e)
+                copy_file_range_supported = False
+
+    if not copy_file_range_supported:
+        shutil.copyfile(src, dst)
+
+    # preserve mtime, used when renaming by mtime
+    shutil.copystat(src, dst)
 
 
 def emit_ha_state_update():
@@ -158,7 +221,7 @@ def handle_card_insert(device_node: str, card_id: str):
 
     try:
         total_progress = 0
-        src_file_list = []
+        grab_jobs = []
 
         # first pass to get file counts
         for grab in app_config.grabs:
@@ -167,12 +230,17 @@ def handle_card_insert(device_node: str, card_id: str):
 
             # count media files
             source_folder = mountpoint / grab.path
-            for src_file in source_folder.iterdir():
-                LOG.debug(f"FOUND: {src_file}")
-                if src_file.name.lower().endswith(tuple(grab.types)):
-                    src_file_list.append(src_file)
-                    app_state.media_count += 1
-                    total_progress += 1
+            src_file_list = []
+            with os.scandir(source_folder) as it:
+                for entry in it:
+                    LOG.debug("FOUND: %s", entry.path)
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() in grab.type_suffixes:
+                        src_file_list.append((entry.path, entry.name))
+            grab_jobs.append((grab, source_folder, src_file_list))
+            app_state.media_count += len(src_file_list)
+            total_progress += len(src_file_list)
 
         if app_state.media_count == 0:
             LOG.warning("No media files found to copy.")
@@ -182,51 +250,56 @@ def handle_card_insert(device_node: str, card_id: str):
             dest_path = app_config.destination_base / f"{card_id}-{timestamp}"
             dest_path.mkdir(parents=True, exist_ok=True)
             if app_config.chown:
-                shutil.chown(dest_path.as_posix(), app_config.chown.user, app_config.chown.group)
+                shutil.chown(dest_path, app_config.chown.user, app_config.chown.group)
 
             # second pass to perform copy operation
             progress = 0
-            for grab in app_config.grabs:
-                source_folder = mountpoint / grab.path
-                target_folder = dest_path / grab.path.split(os.sep)[-1]
+            for grab, source_folder, src_file_list in grab_jobs:
+                target_folder = dest_path / grab.dirname
                 target_folder.mkdir(parents=True, exist_ok=True)
                 if app_config.chown:
-                    shutil.chown(target_folder.as_posix(), app_config.chown.user, app_config.chown.group)
-
-                # for src_file in source_folder.iterdir():
-                #     if src_file.name.lower().endswith(tuple(grab.types)):
-                for src_file in src_file_list:
-                    dest_file = target_folder / src_file.name
-                    LOG.info(f"Copying {src_file.as_posix()} -> {dest_file.as_posix()}")
-                    shutil.copy2(src_file.as_posix(), dest_file.as_posix())
-                    progress += 1
-                    LOG.debug(f"PROGRESS -- {int(progress*100/total_progress)}%")
-                    if progress % 10 == 0:
-                        app_state.progress = progress
-                        emit_ha_state_update()
+                    shutil.chown(target_folder, app_config.chown.user, app_config.chown.group)
+
+                target_dir = os.fspath(target_folder)
+                with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+                    futures = []
+                    for src_file, src_name in src_file_list:
+                        dest_file = os.path.join(target_dir, src_name)
+                        futures.append(executor.submit(copy_file, src_file, dest_file))
+
+                    # progress is only updated from this thread
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                            progress += 1
+                            LOG.debug("PROGRESS -- %d%%", progress*100//total_progress)
+                            if progress % 10 == 0:
+                                app_state.progress = progress
+                                emit_ha_state_update()
+                    except BaseException:
+                        # stop at the first failure, don't attempt the queued copies
+                        executor.shutdown(cancel_futures=True)
+                        raise
 
                 if app_config.delete_after_copy and not grab.never_delete:
-                    LOG.info(f"Deleting files in {source_folder.as_posix()}")
-                    remove_directory(source_folder.as_posix())
-                    source_folder.mkdir(exist_ok=True)
-                    if app_config.chown:
-                        shutil.chown(source_folder.as_posix(), app_config.chown.user, app_config.chown.group)
+                    LOG.info("Deleting files in %s", source_folder)
+                    remove_directory_contents(source_folder)
                 else:
-                    LOG.info(f"Skipping deletion per config: {source_folder.as_posix()}")
+                    LOG.info("Skipping deletion per config: %s", source_folder)
 
                 progress += 1
-                LOG.debug(f"PROGRESS -- {int(progress*100/total_progress)}%")
+                LOG.debug("PROGRESS -- %d%%", progress*100//total_progress)
                 if progress % 10 == 0:
                     app_state.progress = progress
                     emit_ha_state_update()
 
             # renaming?
-            for grab in app_config.grabs:
-                target_folder = dest_path / grab.path.split(os.sep)[-1]
-                LOG.debug(f"ORGANIZE -- {target_folder}")
+            for grab, _, _ in grab_jobs:
+                target_folder = dest_path / grab.dirname
+                LOG.debug("ORGANIZE -- %s", target_folder)
                 organize_files_in_place(target_folder.as_posix(), grab.rename_method, grab.rename_as_prefix, grab.mtime, grab.media_tag, app_config.chown)
                 progress += 1
-                LOG.debug(f"PROGRESS -- {int(progress*100/total_progress)}%")
+                LOG.debug("PROGRESS -- %d%%", progress*100//total_progress)
                 if progress % 10 == 0:
                     app_state.progress = progress
                     emit_ha_state_update()
@@ -263,9 +336,7 @@ def card_event(action: str, device: pyudev.Device):
     :param device: The device object from the udev event.
     """
 
-    drv_match = re.search(r"[hs]d[a-z](\d+)", device.sys_name)
-    mmc_match = re.search(r"mmcblk(\d+)p(\d+)", device.sys_name)
-    if not drv_match and not mmc_match:
+    if not DEVICE_PATTERN.search(device.sys_name):
         LOG.warning(f"Unknown device pattern: {device.sys_name}")
         return
 
@@ -1,14 +1,17 @@
 import logging
 import requests
+import time
 
 from dataclasses import dataclass, asdict
+from requests.adapters import HTTPAdapter
 from typing import Dict
 
-from const import APP_NAME
+from const import AppStatus, APP_NAME
 
 
 LOG = logging.getLogger(__name__)
 SENSOR_ENTITY_ID = f"sensor.{APP_NAME}"
+MIN_BUSY_UPDATE_INTERVAL = 0.5  # seconds
 
 
 @dataclass
@@ -30,6 +33,17 @@ class HomeAssistantAPI:
         """
         self.url = f"{config.base_url}/api"
         self.api_token = config.api_token
+
+        # reuse a single keep-alive connection across state updates
+        self._session = requests.Session()
+        self._session.headers.update(self._get_headers())
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # throttle repeated busy (progress) updates
+        self._last_emit_ts = 0.0
+        self._last_emit_status = None
         LOG.info(f"HomeAssistantAPI initialized with URL: {self.url}")
 
     def _get_headers(self) -> Dict[str, str]:
@@ -52,7 +66,6 @@ class HomeAssistantAPI:
         """
         sensor_entity_id = f"{SENSOR_ENTITY_ID}_{attributes['card_id']}"
         url = f"{self.url}/states/{sensor_entity_id}"
-        headers = self._get_headers()
         payload = {
             "state": state,
             "attributes": {
@@ -62,7 +75,7 @@ class HomeAssistantAPI:
         }
 
         try:
-            response = requests.post(url, json=payload, headers=headers)
+            response = self._session.post(url, json=payload)
             response.raise_for_status()
             LOG.info(f"Successfully updated sensor {sensor_entity_id}: {response.status_code}")
         except requests.RequestException as e:
@@ -74,5 +87,13 @@ class HomeAssistantAPI:
 
         :param app_state: The current application state (AppState object).
         """
+        # status transitions always go through, progress updates are rate limited
+        now = time.monotonic()
+        if (app_state.status == AppStatus.BUSY and self._last_emit_status == AppStatus.BUSY
+                and now - self._last_emit_ts < MIN_BUSY_UPDATE_INTERVAL):
+            return
+        self._last_emit_ts = now
+        self._last_emit_status = app_state.status
+
         attributes = asdict(app_state)
         self.create_or_update_sensor(state=app_state.status.name.capitalize(), attributes=attributes)
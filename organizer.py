@@ -1,14 +1,17 @@
 import logging
+import os
 import shutil
+import time
 
 from dataclasses import dataclass
 from datetime import datetime
 from dateutil.parser import parse as dateutil_parse
 from dateutil.tz import tzlocal, gettz
 from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from pymediainfo import MediaInfo
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -44,6 +47,31 @@ def sanitize_datetime_string(datetime_str, substrs: Optional[List[str]]):
     return datetime_str.strip()
 
 
+def parse_date_string(date_string: str) -> datetime:
+    """
+    Parses a media date tag, trying the C-accelerated ISO 8601 parser before dateutil.
+
+    :param date_string: The sanitized date string, e.g. "2024-01-15 14:22:33".
+    :return: The parsed datetime, timezone-aware only if the string carries an offset.
+    :raises ValueError: If the string cannot be parsed.
+    """
+    try:
+        return datetime.fromisoformat(date_string)
+    except ValueError:
+        return dateutil_parse(date_string)
+
+
+@lru_cache(maxsize=16)
+def get_tz_infos(tz: str):
+    """
+    Resolves the tag and local timezones, cached since they are constant across files.
+
+    :param tz: The timezone string of the media tag.
+    :return: A tuple containing the tag timezone and the local timezone.
+    """
+    return gettz(tz), tzlocal()
+
+
 def get_local_date_from_media_info(file_path: str, media_tag: MediaInfoTag):
     """
     Extracts and converts a date tag from media file metadata into a local timezone.
@@ -55,36 +83,50 @@ def get_local_date_from_media_info(file_path: str, media_tag: MediaInfoTag):
     :raises ValueError: If no tag format is provided or an invalid timezone string is encountered.
     """
     try:
-        tag_tz_info = gettz(media_tag.tz)
-        local_tz_info = tzlocal()
+        tag_tz_info, local_tz_info = get_tz_infos(media_tag.tz)
     except Exception as e:
         raise ValueError(f"Invalid timezone string, err: {e}")
 
-    media_info = MediaInfo.parse(file_path)
+    # only the date tag is needed, use the fastest parse
+    media_info = MediaInfo.parse(file_path, parse_speed=0.0)
 
     # look for the tag
-    for track in media_info.tracks:
-        if track.track_type == media_tag.group:
-            date_string = getattr(track, media_tag.name.replace(" ", "_").lower(), None)  # e.g. encoded_date
-            if date_string:
-                try:
-                    # parse the date tag
-                    date_string = sanitize_datetime_string(date_string, media_tag.substrs)
-                    tag_date = dateutil_parse(date_string)
-
-                    # if no timezone is found, use provided (default: UTC)
-                    if tag_date.tzinfo is None:
-                        tag_date = tag_date.replace(tzinfo=tag_tz_info)
-
-                    # convert to local timezone
-                    local_date = tag_date.astimezone(local_tz_info)
-                    return local_date.year, local_date.month, local_date.day
-                except ValueError as e:
-                    LOG.error(f"Error parsing date '{date_string}': {e}")
-                    return None
-
-    LOG.warning(f"Tag '{media_tag.name}' not found in the media file.")
-    return None
+    tag_attr = media_tag.name.replace(" ", "_").lower()  # e.g. encoded_date
+    date_string = next(
+        (value for track in media_info.tracks
+         if track.track_type == media_tag.group and (value := getattr(track, tag_attr, None))),
+        None
+    )
+    if not date_string:
+        LOG.warning(f"Tag '{media_tag.name}' not found in the media file.")
+        return None
+
+    try:
+        # parse the date tag
+        date_string = sanitize_datetime_string(date_string, media_tag.substrs)
+        tag_date = parse_date_string(date_string)
+
+        # if no timezone is found, use provided (default: UTC)
+        if tag_date.tzinfo is None:
+            tag_date = tag_date.replace(tzinfo=tag_tz_info)
+
+        # convert to local timezone
+        local_date = tag_date.astimezone(local_tz_info)
+        return local_date.year, local_date.month, local_date.day
+    except ValueError as e:
+        LOG.error(f"Error parsing date '{date_string}': {e}")
+        return None
+
+
+def get_date_folders(timestamp: float) -> Tuple[str, str, str]:
+    """
+    Formats a timestamp into local year, month and day folder names.
+
+    :param timestamp: Seconds since the epoch, e.g. a file's st_mtime.
+    :return: A tuple containing the year, zero-padded month and zero-padded day strings.
+    """
+    local_time = time.localtime(timestamp)
+    return str(local_time.tm_year), f"{local_time.tm_mon:02d}", f"{local_time.tm_mday:02d}"
 
 
 def organize_files_in_place(directory: str, rename_method: RenameMethod = RenameMethod.TREE, rename_as_prefix: bool = True, mtime: bool = True, media_tag: Optional[MediaInfoTag] = None, chown: Optional["ChownIds"] = None):
@@ -104,38 +146,45 @@ def organize_files_in_place(directory: str, rename_method: RenameMethod = Rename
     if not directory.exists() or not directory.is_dir():
         raise FileNotFoundError(f"The directory '{directory}' does not exist or is not a directory.")
 
+    # Snapshot the directory entries, files are moved or renamed in place below
+    with os.scandir(directory) as it:
+        entries = list(it)
+
     # Iterate through all files in the directory
     file_idx = 0
-    for file_path in directory.iterdir():
+    created_folders = set()
+    for entry in entries:
         # Skip directories, process only files
-        if not file_path.is_file():
+        if not entry.is_file():
             continue
 
         file_idx += 1
+        file_path = Path(entry.path)
 
-        # Get the file's modified time (or creation time, if preferred)
-        file_datestamp = datetime.fromtimestamp(file_path.stat().st_mtime)
-
-        # Construct the year, month, and day folder structure
-        year_folder = str(file_datestamp.year)
-        month_folder = f"{file_datestamp.month:02d}"  # Zero-padded month
-        day_folder = f"{file_datestamp.day:02d}"  # Zero-padded day
+        # Construct the year, month, and day folder structure from the file's modified time
+        year_folder, month_folder, day_folder = get_date_folders(entry.stat().st_mtime)
 
         # Build the full folder path in the same directory
         if rename_method == RenameMethod.TREE:
             destination_folder = directory / year_folder / month_folder / day_folder
-            destination_folder.mkdir(parents=True, exist_ok=True)  # Create folders if they don't exist
-            if chown:
-                shutil.chown(destination_folder.as_posix(), chown.user, chown.group)
+            if destination_folder not in created_folders:
+                destination_folder.mkdir(parents=True, exist_ok=True)  # Create folders if they don't exist
+                if chown:
+                    shutil.chown(destination_folder, chown.user, chown.group)
+                created_folders.add(destination_folder)
         elif rename_method == RenameMethod.OVERWRITE:
             destination_folder = directory
         else:
             raise ValueError(f"Invalid rename method: {rename_method}")
 
-        p = file_path.name
-        for suf in file_path.suffixes:
-            p = p.replace(suf, '')
-        single_ext_file_name = f"{p}{file_path.suffixes[-1]}"
+        # collapse multiple extensions to the last one (e.g. 'clip.tmp.mp4' -> 'clip.mp4')
+        name = entry.name
+        dot = name.find('.', 1)  # a leading dot belongs to the stem
+        if dot < 0:
+            stem, ext = name, ''
+        else:
+            stem, ext = name[:dot], name[name.rfind('.'):]
+        single_ext_file_name = f"{stem}{ext}"
 
         new_file_name = None
 
@@ -148,32 +197,33 @@ def organize_files_in_place(directory: str, rename_method: RenameMethod = Rename
                 if rename_as_prefix:
                     new_file_name = f"{date_str}_{single_ext_file_name}"
                 else:
-                    new_file_name = f"{date_str}-{file_idx:05d}{file_path.suffix}"
-                LOG.debug(f"Using mediainfo based name:  {new_file_name}")
+                    new_file_name = f"{date_str}-{file_idx:05d}{ext}"
+                LOG.debug("Using mediainfo based name:  %s", new_file_name)
 
         # or, generate name from file modified datestamp?
         if mtime is True and new_file_name is None:
-            formatted_date = f"{file_datestamp.year}{file_datestamp.month:02d}{file_datestamp.day:02d}"
+            formatted_date = f"{year_folder}{month_folder}{day_folder}"
             if rename_as_prefix:
                 new_file_name = f"{formatted_date}_{single_ext_file_name}"
             else:
-                new_file_name = f"{formatted_date}-{file_idx:05d}{file_path.suffix}"
-            LOG.debug(f"Using mtime based name:  {new_file_name}")
+                new_file_name = f"{formatted_date}-{file_idx:05d}{ext}"
+            LOG.debug("Using mtime based name:  %s", new_file_name)
 
         # otherwise, use original name
         if new_file_name is None:
             new_file_name = single_ext_file_name
-            LOG.debug(f"Using original name: {new_file_name}")
+            LOG.debug("Using original name: %s", new_file_name)
 
         # Build the destination file path
         dest_file_path = destination_folder / new_file_name
 
-        # Move the file into the appropriate day folder with the new name
-        shutil.move(file_path.as_posix(), dest_file_path.as_posix())
+        # Move the file into the appropriate day folder with the new name,
+        #   always within `directory` so a rename suffices (replace overwrites, as shutil.move did)
+        os.replace(file_path, dest_file_path)
         if chown:
-            shutil.chown(dest_file_path.as_posix(), chown.user, chown.group)
+            shutil.chown(dest_file_path, chown.user, chown.group)
 
-        LOG.info(f"Moved: '{file_path}' -> '{dest_file_path}'")
+        LOG.info("Moved: '%s' -> '%s'", file_path, dest_file_path)
 
 
 if __name__ == "__main__":